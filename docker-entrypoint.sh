@@ -0,0 +1,12 @@
+#!/bin/sh
+set -e
+
+# Apply pending migrations before starting the app. The lock lives on the
+# instance volume so containers sharing it don't run upgrades concurrently.
+# Set SKIP_MIGRATIONS=1 to start without touching the schema.
+if [ "${SKIP_MIGRATIONS:-0}" != "1" ]; then
+    mkdir -p /app/instance
+    flock /app/instance/.migrate.lock flask db upgrade
+fi
+
+exec "$@"
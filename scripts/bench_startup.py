@@ -0,0 +1,91 @@
+"""Measure cold-start cost of the app: import, create_app() and first request.
+
+Each run happens in a fresh interpreter so module caches don't hide the cost.
+
+    python scripts/bench_startup.py --runs 10
+    python scripts/bench_startup.py --budget-ms 800   # exit 1 if over budget
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src')
+
+# Modules create_app() should no longer import; they load on first use instead.
+LAZY_MODULES = ['markdown', 'bleach', 'email_validator', 'dns', 'server.forms']
+
+CHILD = """
+import json, sys, time
+t0 = time.perf_counter()
+import server
+t1 = time.perf_counter()
+app = server.create_app()
+t2 = time.perf_counter()
+loaded = [m for m in %(lazy)r if m in sys.modules]
+client = app.test_client()
+t3 = time.perf_counter()
+resp = client.get(%(path)r)
+t4 = time.perf_counter()
+client.get(%(path)r)
+t5 = time.perf_counter()
+print(json.dumps({
+    'import_ms': (t1 - t0) * 1000,
+    'create_app_ms': (t2 - t1) * 1000,
+    'first_request_ms': (t4 - t3) * 1000,
+    'warm_request_ms': (t5 - t4) * 1000,
+    'status': resp.status_code,
+    'eager_modules': loaded,
+}))
+"""
+
+METRICS = ['import_ms', 'create_app_ms', 'first_request_ms', 'warm_request_ms']
+
+
+def run_once(path, db_url):
+    env = dict(os.environ, DATABASE_URL=db_url)
+    out = subprocess.run(
+        [sys.executable, '-c', CHILD % {'lazy': LAZY_MODULES, 'path': path}],
+        cwd=SRC_DIR, env=env, capture_output=True, text=True, check=True,
+    )
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--path', default='/auth/login', help='URL for the first request')
+    parser.add_argument('--budget-ms', type=float, default=None,
+                        help='fail if median import + create_app + first request exceeds this')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_url = 'sqlite:///' + os.path.join(tmp, 'bench.db')
+        results = [run_once(args.path, db_url) for _ in range(args.runs)]
+
+    print(f"{'metric':<20}{'median':>10}{'min':>10}{'max':>10}  (ms, {args.runs} runs)")
+    medians = {}
+    for name in METRICS:
+        values = [r[name] for r in results]
+        medians[name] = statistics.median(values)
+        print(f"{name:<20}{medians[name]:>10.1f}{min(values):>10.1f}{max(values):>10.1f}")
+
+    total = medians['import_ms'] + medians['create_app_ms'] + medians['first_request_ms']
+    print(f"{'startup total':<20}{total:>10.1f}")
+    print(f"first request {args.path} -> HTTP {results[0]['status']}")
+
+    eager = results[0]['eager_modules']
+    if eager:
+        print(f"warning: loaded during create_app(): {', '.join(eager)}")
+
+    if args.budget_ms is not None and total > args.budget_ms:
+        print(f"over budget: {total:.1f}ms > {args.budget_ms:.1f}ms")
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
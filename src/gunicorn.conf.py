@@ -0,0 +1,23 @@
+# Gunicorn settings, picked up automatically from the working directory.
+# Anything here can be overridden with GUNICORN_CMD_ARGS at deploy time.
+import os
+
+bind = os.environ.get('GUNICORN_BIND', '0.0.0.0:5000')
+
+# Import the app once in the master and fork workers from it, instead of
+# every worker running create_app() on its own.
+preload_app = True
+
+
+def when_ready(server):
+    """Runs in the master before any worker is forked."""
+    from server import warm_imports
+    warm_imports()
+
+
+def post_fork(server, worker):
+    """Make sure no worker shares a DB connection with the master."""
+    flask_app = server.app.callable  # Only set when the app was preloaded
+    if flask_app is not None:
+        from server import dispose_engines
+        dispose_engines(flask_app)
@@ -4,8 +4,6 @@ from flask_migrate import Migrate
 from flask_login import LoginManager # Import LoginManager
 import os
 from dotenv import load_dotenv
-import markdown
-import bleach
 from markupsafe import Markup
 
 dotenv_path = os.path.join(os.path.dirname(__file__), '..', '.env')
@@ -35,11 +33,35 @@ def markdown_to_html(text):
         'a': ['href', 'title', 'target'],
         'img': ['src', 'alt', 'title', 'width', 'height'],
     }
+    # Imported on first render rather than at module load: only the memo
+    # templates use this filter, so workers and CLI commands don't pay for it.
+    import markdown
+    import bleach
+
     html = markdown.markdown(text, extensions=['fenced_code', 'tables', 'nl2br'])
     safe_html = bleach.clean(html, tags=allowed_tags, attributes=allowed_attrs, strip=True)
     # The Markup object is now correctly imported from markupsafe
     return Markup(safe_html)
 
+def warm_imports():
+    """Import the modules that routes otherwise load on first use.
+
+    Called from the gunicorn master when the app is preloaded, so the cost is
+    paid once before forking instead of on each worker's first request.
+    """
+    markdown_to_html('')  # also loads the markdown extensions
+    from . import forms
+
+
+def dispose_engines(app):
+    """Drop pooled DB connections inherited from a parent process."""
+    with app.app_context():
+        for engine in db.engines.values():
+            # close=False leaves the parent's connections alone; the child
+            # simply starts with an empty pool.
+            engine.dispose(close=False)
+
+
 def create_app():
     app = Flask(__name__, instance_relative_config=False)
 
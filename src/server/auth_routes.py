@@ -2,7 +2,6 @@ from flask import Blueprint, render_template, redirect, url_for, flash, request
 from flask_login import login_user, logout_user, current_user, login_required
 from . import db
 from .models import User
-from .forms import LoginForm, SignupForm
 
 # Create Auth Blueprint
 bp = Blueprint('auth', __name__)
@@ -12,6 +11,8 @@ bp = Blueprint('auth', __name__)
 def signup():
     if current_user.is_authenticated:
         return redirect(url_for('main.index'))  # Redirect if already logged in
+    # Deferred: SignupForm's Email() validator imports email_validator/dnspython
+    from .forms import SignupForm
     form = SignupForm()
     if form.validate_on_submit():
         # Check if host user already exists (assuming first user is host)
@@ -30,6 +31,7 @@ def signup():
 def login():
     if current_user.is_authenticated:
         return redirect(url_for('main.index'))  # Redirect if already logged in
+    from .forms import LoginForm
     form = LoginForm()
     if form.validate_on_submit():
         user = User.query.filter_by(username=form.username.data).first()
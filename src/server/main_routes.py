@@ -9,7 +9,6 @@ from werkzeug.utils import secure_filename
 
 from . import db  # Import db instance
 from .models import Memo, Resource  # Import Memo model
-from .forms import MemoForm  # Import MemoForm
 
 bp = Blueprint('main', __name__)
 # Define max file size (e.g., 50MB) - reuse this
@@ -18,6 +17,7 @@ MAX_FILE_SIZE = 50 * 1024 * 1024
 @bp.route('/', methods=['GET', 'POST'])
 @login_required
 def index():
+    from .forms import MemoForm  # Deferred: forms pull in WTForms validators
     form = MemoForm()
     if form.validate_on_submit():
         # 1. Create Memo object (without saving yet)
@@ -112,6 +112,7 @@ def edit_memo(memo_id):
         abort(403)  # Forbidden error if not the owner
 
     # Use the same MemoForm
+    from .forms import MemoForm
     form = MemoForm()
 
     if form.validate_on_submit():  # This runs on POST request after validation